@@ -0,0 +1,38 @@
+# cython: language_level=3
+"""
+Cython versions of mathpy.add and mathpy.Counter.
+
+Used by `python examples/test.py --bench` to compare the cost of a call
+into a Cython extension with a call into the PyO3 one, so that changes in
+PyO3's call overhead show up in the benchmark output.
+
+Build it in place, next to test.py:
+    pip install cython
+    cythonize -i examples/mathpy_cy.pyx
+"""
+
+
+cpdef long long add(long long a, long long b):
+    """Adds two numbers together."""
+    return a + b
+
+
+cdef class Counter:
+    """A counter that can be incremented."""
+
+    cdef long long value
+
+    def __init__(self, long long start=0):
+        self.value = start
+
+    cpdef long long get_value(self):
+        """Gets the current counter value."""
+        return self.value
+
+    cpdef void increment(self):
+        """Increments the counter by 1."""
+        self.value += 1
+
+    cpdef void increment_by(self, long long amount):
+        """Increments the counter by a specific amount."""
+        self.value += amount
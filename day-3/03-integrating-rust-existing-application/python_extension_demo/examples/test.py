@@ -3,311 +3,816 @@
 Test script for the mathpy Python extension module.
 
 This demonstrates all the functions and classes provided by the Rust extension.
+
+Usage:
+    python examples/test.py            # run the tests
+    python examples/test.py --bench    # run the tests, then the benchmarks
+    python examples/test.py --verbose  # also print every intermediate result
+    python -O examples/test.py --bench # strip all checks, time only the calls
+
+Set MATHPY_VERBOSE_TB=1 to print the full traceback of unexpected errors.
 """
 
-def test_basic_functions():
+import heapq
+import os
+import sys
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from timeit import timeit
+
+import numpy as np
+
+try:
+    import mathpy
+except ImportError as e:
+    mathpy = None
+    mathpy_import_error = e
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import mathpy_cy  # optional Cython build of examples/mathpy_cy.pyx
+except ImportError:
+    mathpy_cy = None
+
+
+def test_basic_functions(verbose=False):
     """Test basic mathematical functions."""
     print("=" * 60)
     print("Testing Basic Functions")
     print("=" * 60)
     
-    import mathpy
-    
     # Test add
     result = mathpy.add(5, 3)
-    print(f"add(5, 3) = {result}")
-    assert result == 8, "add failed"
+    if __debug__:
+        if verbose:
+            print(f"add(5, 3) = {result}")
+        assert result == 8, "add failed"
     
     # Test multiply
     result = mathpy.multiply(6, 7)
-    print(f"multiply(6, 7) = {result}")
-    assert result == 42, "multiply failed"
+    if __debug__:
+        if verbose:
+            print(f"multiply(6, 7) = {result}")
+        assert result == 42, "multiply failed"
     
     # Test divide
     result = mathpy.devide(10.0, 2.0)
-    print(f"divide(10.0, 2.0) = {result}")
-    assert result == 5.0, "dvide failed"
+    if __debug__:
+        if verbose:
+            print(f"divide(10.0, 2.0) = {result}")
+        assert result == 5.0, "dvide failed"
     
     # Test divide by zero
     try:
         mathpy.devide(10.0, 0.0)
         print("ERROR: divide by zero should have raised an exception")
     except ValueError as e:
-        print(f"divide(10.0, 0.0) correctly raised ValueError: {e}")
-    
-    # Test sum_list
-    numbers = [1, 2, 3, 4, 5]
-    result = mathpy.sum_list(numbers)
-    print(f"sum_list({numbers}) = {result}")
-    assert result == 15, "sum_list failed"
+        if verbose:
+            print(f"divide(10.0, 0.0) correctly raised ValueError: {e}")
+    
+    # Test batched variants: one call into Rust for the whole array
+    n = 10**4
+    a = np.arange(n, dtype=np.int64)
+    b = np.arange(n, 2 * n, dtype=np.int64)
+    result = mathpy.add_many(a, b)
+    if __debug__:
+        if verbose:
+            print(f"add_many(a, b) on {n} elements, first = {result[:3]}")
+        assert np.array_equal(result, a + b), "add_many failed"
+    
+    result = mathpy.multiply_many(a, b)
+    if __debug__:
+        if verbose:
+            print(f"multiply_many(a, b) on {n} elements, first = {result[:3]}")
+        assert np.array_equal(result, a * b), "multiply_many failed"
+    
+    x = a.astype(np.float64)
+    y = b.astype(np.float64)
+    result = mathpy.devide_many(x, y)
+    if __debug__:
+        if verbose:
+            print(f"devide_many(x, y) on {n} elements, first = {result[:3]}")
+        assert np.array_equal(result, x / y), "devide_many failed"
+    
+    # Test batched divide by zero and length mismatch
+    try:
+        mathpy.devide_many(x, np.zeros(n))
+        print("ERROR: devide_many by zero should have raised an exception")
+    except ValueError as e:
+        if verbose:
+            print(f"devide_many(x, zeros) correctly raised ValueError: {e}")
     
-    # Test max_list
-    result = mathpy.max_list(numbers)
-    print(f"max_list({numbers}) = {result}")
-    assert result == 5, "max_list failed"
+    try:
+        mathpy.add_many(a, b[:-1])
+        print("ERROR: add_many with mismatched lengths should have raised an exception")
+    except ValueError as e:
+        if verbose:
+            print(f"add_many(a, b[:-1]) correctly raised ValueError: {e}")
+    
+    # Test sum_list and max_list with each supported input type: a NumPy
+    # array and an array.array buffer (both read in place), a strided NumPy
+    # array (copied first) and a plain list
+    for numbers in (np.arange(1, 6, dtype=np.int64), array("q", [1, 2, 3, 4, 5]),
+                    np.arange(1, 6, dtype=np.int64).repeat(2)[::2], [1, 2, 3, 4, 5]):
+        result = mathpy.sum_list(numbers)
+        if __debug__:
+            if verbose:
+                print(f"sum_list({numbers!r}) = {result}")
+            assert result == 15, f"sum_list failed for {type(numbers).__name__}"
+        
+        result = mathpy.max_list(numbers)
+        if __debug__:
+            if verbose:
+                print(f"max_list({numbers!r}) = {result}")
+            assert result == 5, f"max_list failed for {type(numbers).__name__}"
     
     # Test max_list with empty list
     try:
-        mathpy.max_list([])
+        mathpy.max_list(np.array([], dtype=np.int64))
         print("ERROR: max_list([]) should have raised an exception")
     except ValueError as e:
-        print(f"max_list([]) correctly raised ValueError: {e}")
+        if verbose:
+            print(f"max_list([]) correctly raised ValueError: {e}")
     
     print("\n✓ All basic function tests passed!\n")
 
 
-def test_string_functions():
+def test_string_functions(verbose=False):
     """Test string manipulation functions."""
     print("=" * 60)
     print("Testing String Functions")
     print("=" * 60)
     
-    import mathpy
-    
     # Test greet
     result = mathpy.greet("Alice")
-    print(f"greet('Alice') = '{result}'")
-    assert "Alice" in result, "greet failed"
+    if __debug__:
+        if verbose:
+            print(f"greet('Alice') = '{result}'")
+        assert "Alice" in result, "greet failed"
     
     # Test to_uppercase
     result = mathpy.to_uppercase("hello world")
-    print(f"to_uppercase('hello world') = '{result}'")
-    assert result == "HELLO WORLD", "to_uppercase failed"
+    if __debug__:
+        if verbose:
+            print(f"to_uppercase('hello world') = '{result}'")
+        assert result == "HELLO WORLD", "to_uppercase failed"
     
     # Test word_frequency
     text = "the quick brown fox jumps over the lazy dog the"
     result = mathpy.word_frequency(text)
-    print(f"word_frequency('{text}') =")
-    for word, count in sorted(result.items()):
-        print(f"  {word}: {count}")
-    assert result["the"] == 3, "word_frequency failed"
-    assert result["quick"] == 1, "word_frequency failed"
+    if __debug__:
+        if verbose:
+            # Top 10 by count, without sorting every (word, count) pair
+            print(f"word_frequency('{text}') top 10 =")
+            for word, count in heapq.nlargest(10, result.items(), key=lambda kv: kv[1]):
+                print(f"  {word}: {count}")
+        assert result["the"] == 3, "word_frequency failed"
+        assert result["quick"] == 1, "word_frequency failed"
+    
+    # Test word_frequency_bytes on a multi-MB corpus
+    corpus = " ".join([text] * 100_000).encode()
+    start = time.perf_counter()
+    result = mathpy.word_frequency_bytes(corpus)
+    elapsed = time.perf_counter() - start
+    if __debug__:
+        if verbose:
+            print(f"word_frequency_bytes({len(corpus) / 1e6:.1f} MB corpus) = "
+                  f"{len(result)} words in {elapsed * 1e3:.1f} ms, top 3 = "
+                  f"{heapq.nlargest(3, result.items(), key=lambda kv: kv[1])}")
+        assert result[b"the"] == 300_000, "word_frequency_bytes failed"
+        assert result[b"quick"] == 100_000, "word_frequency_bytes failed"
+        expected = {word.encode(): count * 100_000
+                    for word, count in mathpy.word_frequency(text).items()}
+        assert result == expected, "word_frequency_bytes disagrees with word_frequency"
+    
+    # Test word_frequency_bytes from 8 threads at once (it releases the GIL
+    # for inputs of 1 MB or more, so use 2 MB corpora)
+    corpora = [" ".join([f"corpus{i} shared words"] * 100_000).encode()
+               for i in range(8)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(mathpy.word_frequency_bytes, corpora))
+    if __debug__:
+        if verbose:
+            print(f"word_frequency_bytes on 8 threads = {[len(r) for r in results]} words")
+        for i, result in enumerate(results):
+            assert result == {f"corpus{i}".encode(): 100_000, b"shared": 100_000,
+                              b"words": 100_000}, "threaded word_frequency_bytes failed"
     
     print("\n✓ All string function tests passed!\n")
 
 
-def test_counter_class():
+def test_counter_class(verbose=False):
     """Test the Counter class."""
     print("=" * 60)
     print("Testing Counter Class")
     print("=" * 60)
     
-    import mathpy
-    
     # Create counter
     counter = mathpy.Counter()
-    print(f"Created counter: {counter}")
-    assert counter.get_value() == 0, "Initial value should be 0"
+    if __debug__:
+        if verbose:
+            print(f"Created counter: {counter}")
+        assert counter.get_value() == 0, "Initial value should be 0"
     
     # Test increment
     counter.increment()
-    print(f"After increment(): {counter}")
-    assert counter.get_value() == 1, "Value should be 1"
+    if __debug__:
+        if verbose:
+            print(f"After increment(): {counter}")
+        assert counter.get_value() == 1, "Value should be 1"
     
     # Test increment_by
     counter.increment_by(5)
-    print(f"After increment_by(5): {counter}")
-    assert counter.get_value() == 6, "Value should be 6"
+    if __debug__:
+        if verbose:
+            print(f"After increment_by(5): {counter}")
+        assert counter.get_value() == 6, "Value should be 6"
     
     # Test decrement
     counter.decrement()
-    print(f"After decrement(): {counter}")
-    assert counter.get_value() == 5, "Value should be 5"
+    if __debug__:
+        if verbose:
+            print(f"After decrement(): {counter}")
+        assert counter.get_value() == 5, "Value should be 5"
     
     # Test reset
     counter.reset()
-    print(f"After reset(): {counter}")
-    assert counter.get_value() == 0, "Value should be 0"
+    if __debug__:
+        if verbose:
+            print(f"After reset(): {counter}")
+        assert counter.get_value() == 0, "Value should be 0"
     
     # Test custom start
     counter2 = mathpy.Counter(start=10)
-    print(f"Created counter with start=10: {counter2}")
-    assert counter2.get_value() == 10, "Value should be 10"
+    if __debug__:
+        if verbose:
+            print(f"Created counter with start=10: {counter2}")
+        assert counter2.get_value() == 10, "Value should be 10"
+    
+    # Test sharing one counter between threads
+    counter3 = mathpy.Counter()
+    
+    def hammer(_):
+        increment = counter3.increment
+        for _ in range(10_000):
+            increment()
+    
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(hammer, range(8)))
+    if __debug__:
+        if verbose:
+            print(f"After 8 threads x 10000 increment(): {counter3}")
+        assert counter3.get_value() == 80_000, "Value should be 80000"
     
     print("\n✓ All Counter class tests passed!\n")
 
 
-def test_point_class():
+def test_point_class(verbose=False):
     """Test the Point class."""
     print("=" * 60)
     print("Testing Point Class")
     print("=" * 60)
     
-    import mathpy
-    
     # Create points
     p1 = mathpy.Point(0.0, 0.0)
     p2 = mathpy.Point(3.0, 4.0)
-    print(f"Created p1: {p1}")
-    print(f"Created p2: {p2}")
+    if __debug__:
+        if verbose:
+            print(f"Created p1: {p1}")
+            print(f"Created p2: {p2}")
     
     # Test properties
-    assert p1.x == 0.0 and p1.y == 0.0, "p1 coordinates wrong"
-    assert p2.x == 3.0 and p2.y == 4.0, "p2 coordinates wrong"
+    if __debug__:
+        assert p1.x == 0.0 and p1.y == 0.0, "p1 coordinates wrong"
+        assert p2.x == 3.0 and p2.y == 4.0, "p2 coordinates wrong"
     
     # Test distance
     distance = p1.distance_to(p2)
-    print(f"distance(p1, p2) = {distance}")
-    assert abs(distance - 5.0) < 0.001, "Distance should be 5.0"
+    if __debug__:
+        if verbose:
+            print(f"distance(p1, p2) = {distance}")
+        assert abs(distance - 5.0) < 0.001, "Distance should be 5.0"
     
     # Test midpoint
     mid = p1.midpoint(p2)
-    print(f"midpoint(p1, p2) = {mid}")
-    assert mid.x == 1.5 and mid.y == 2.0, "Midpoint wrong"
+    if __debug__:
+        if verbose:
+            print(f"midpoint(p1, p2) = {mid}")
+        assert mid.x == 1.5 and mid.y == 2.0, "Midpoint wrong"
+    
+    # Test distance and midpoint in one call
+    distance, mid = p1.distance_and_midpoint(p2)
+    if __debug__:
+        if verbose:
+            print(f"distance_and_midpoint(p1, p2) = ({distance}, {mid})")
+        assert abs(distance - 5.0) < 0.001, "Fused distance should be 5.0"
+        assert mid.x == 1.5 and mid.y == 2.0, "Fused midpoint wrong"
     
     # Test translate
     p3 = mathpy.Point(10.0, 20.0)
-    print(f"Created p3: {p3}")
+    if __debug__:
+        if verbose:
+            print(f"Created p3: {p3}")
     p3.translate(5.0, -3.0)
-    print(f"After translate(5.0, -3.0): {p3}")
-    assert p3.x == 15.0 and p3.y == 17.0, "Translation failed"
+    if __debug__:
+        if verbose:
+            print(f"After translate(5.0, -3.0): {p3}")
+        assert p3.x == 15.0 and p3.y == 17.0, "Translation failed"
     
     # Test property setter
     p3.x = 100.0
     p3.y = 200.0
-    print(f"After setting x=100.0, y=200.0: {p3}")
-    assert p3.x == 100.0 and p3.y == 200.0, "Property setter failed"
+    if __debug__:
+        if verbose:
+            print(f"After setting x=100.0, y=200.0: {p3}")
+        assert p3.x == 100.0 and p3.y == 200.0, "Property setter failed"
+    
+    # Test pairwise_distance on 10^6 points held in (N, 2) arrays
+    rng = np.random.default_rng(0)
+    a = rng.uniform(-100.0, 100.0, size=(10**6, 2))
+    b = rng.uniform(-100.0, 100.0, size=(10**6, 2))
+    start = time.perf_counter()
+    distances = mathpy.pairwise_distance(a, b)
+    elapsed = time.perf_counter() - start
+    if __debug__:
+        if verbose:
+            print(f"pairwise_distance({len(a)} points) in {elapsed * 1e3:.1f} ms")
+        assert distances.shape == (len(a),), "pairwise_distance shape wrong"
+        assert np.allclose(distances, np.hypot(*(a - b).T)), "pairwise_distance wrong"
+    
+    try:
+        mathpy.pairwise_distance(a, b[:, :1].copy())
+        print("ERROR: pairwise_distance with shape (N, 1) should have raised an exception")
+    except ValueError as e:
+        if verbose:
+            print(f"pairwise_distance(a, b[:, :1]) correctly raised ValueError: {e}")
+    
+    # Test Point32: f32 coordinates, so compare with a 1e-4 tolerance
+    q1 = mathpy.Point32(0.1, 0.2)
+    q2 = mathpy.Point32(3.1, 4.2)
+    distance = q1.distance_to(q2)
+    if __debug__:
+        if verbose:
+            print(f"Point32 distance({q1}, {q2}) = {distance}")
+        assert abs(distance - 5.0) < 1e-4, "Point32 distance should be 5.0"
+        mid = q1.midpoint(q2)
+        assert abs(mid.x - 1.6) < 1e-4 and abs(mid.y - 2.2) < 1e-4, "Point32 midpoint wrong"
+    
+    # Test pairwise_distance_f32 against the float64 result
+    a32 = a.astype(np.float32)
+    b32 = b.astype(np.float32)
+    distances32 = mathpy.pairwise_distance_f32(a32, b32)
+    if __debug__:
+        if verbose:
+            print(f"pairwise_distance_f32({len(a32)} points), first = {distances32[:3]}")
+        assert distances32.dtype == np.float32, "pairwise_distance_f32 should return float32"
+        assert np.allclose(distances32, distances, rtol=1e-4, atol=1e-4), \
+            "pairwise_distance_f32 wrong"
     
     print("\n✓ All Point class tests passed!\n")
 
 
-def test_calculator_class():
+def test_calculator_class(verbose=False):
     """Test the Calculator class."""
     print("=" * 60)
     print("Testing Calculator Class")
     print("=" * 60)
     
-    import mathpy
-    
     calc = mathpy.Calculator()
-    print(f"Created calculator: {calc}")
-    assert calc.get_result() == 0.0, "Initial value should be 0"
+    if __debug__:
+        if verbose:
+            print(f"Created calculator: {calc}")
+        assert calc.get_result() == 0.0, "Initial value should be 0"
     
     # Test add
     calc.add(10.0)
-    print(f"After add(10.0): {calc}")
-    assert calc.get_result() == 10.0, "Result should be 10.0"
+    if __debug__:
+        if verbose:
+            print(f"After add(10.0): {calc}")
+        assert calc.get_result() == 10.0, "Result should be 10.0"
     
     # Test multiply
     calc.multiply(2.0)
-    print(f"After multiply(2.0): {calc}")
-    assert calc.get_result() == 20.0, "Result should be 20.0"
+    if __debug__:
+        if verbose:
+            print(f"After multiply(2.0): {calc}")
+        assert calc.get_result() == 20.0, "Result should be 20.0"
     
     # Test subtract
     calc.subtract(5.0)
-    print(f"After subtract(5.0): {calc}")
-    assert calc.get_result() == 15.0, "Result should be 15.0"
+    if __debug__:
+        if verbose:
+            print(f"After subtract(5.0): {calc}")
+        assert calc.get_result() == 15.0, "Result should be 15.0"
     
     # Test divide
     calc.devide(3.0)
-    print(f"After divide(3.0): {calc}")
-    assert calc.get_result() == 5.0, "Result should be 5.0"
+    if __debug__:
+        if verbose:
+            print(f"After divide(3.0): {calc}")
+        assert calc.get_result() == 5.0, "Result should be 5.0"
     
     # Test divide by zero
     try:
         calc.devide(0.0)
         print("ERROR: devide by zero should have raised an exception")
     except ValueError as e:
-        print(f"devide(0.0) correctly raised ValueError: {e}")
+        if verbose:
+            print(f"devide(0.0) correctly raised ValueError: {e}")
     
     # Test reset
     calc.reset()
-    print(f"After reset(): {calc}")
-    assert calc.get_result() == 0.0, "Result should be 0.0"
+    if __debug__:
+        if verbose:
+            print(f"After reset(): {calc}")
+        assert calc.get_result() == 0.0, "Result should be 0.0"
+    
+    # Test sharing one calculator between threads
+    def add_ones(_):
+        add = calc.add
+        for _ in range(10_000):
+            add(1.0)
+    
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(add_ones, range(8)))
+    if __debug__:
+        if verbose:
+            print(f"After 8 threads x 10000 add(1.0): {calc}")
+        assert calc.get_result() == 80_000.0, "Result should be 80000.0"
     
     print("\n✓ All Calculator class tests passed!\n")
 
 
-def test_person_class():
+def test_person_class(verbose=False):
     """Test the Person class."""
     print("=" * 60)
     print("Testing Person Class")
     print("=" * 60)
     
-    import mathpy
-    
     # Create person
     person = mathpy.Person("Alice", 30)
-    print(f"Created person: {person}")
-    assert person.name == "Alice", "Name should be Alice"
-    assert person.age == 30, "Age should be 30"
+    if __debug__:
+        if verbose:
+            print(f"Created person: {person}")
+        assert person.name == "Alice", "Name should be Alice"
+        assert person.age == 30, "Age should be 30"
     
     # Test greet
     greeting = person.greet()
-    print(f"person.greet() = '{greeting}'")
-    assert "Alice" in greeting and "30" in greeting, "Greeting wrong"
+    if __debug__:
+        if verbose:
+            print(f"person.greet() = '{greeting}'")
+        assert "Alice" in greeting and "30" in greeting, "Greeting wrong"
     
     # Test is_adult
     is_adult = person.is_adult()
-    print(f"person.is_adult() = {is_adult}")
-    assert is_adult == True, "Should be adult"
+    if __debug__:
+        if verbose:
+            print(f"person.is_adult() = {is_adult}")
+        assert is_adult == True, "Should be adult"
     
     # Test have_birthday
     person.have_birthday()
-    print(f"After have_birthday(): {person}")
-    assert person.age == 31, "Age should be 31"
+    if __debug__:
+        if verbose:
+            print(f"After have_birthday(): {person}")
+        assert person.age == 31, "Age should be 31"
     
     # Test property setters
     person.name = "Bob"
     person.age = 25
-    print(f"After setting name='Bob', age=25: {person}")
-    assert person.name == "Bob" and person.age == 25, "Properties not set"
+    if __debug__:
+        if verbose:
+            print(f"After setting name='Bob', age=25: {person}")
+        assert person.name == "Bob" and person.age == 25, "Properties not set"
     
     # Test negative age
     try:
         mathpy.Person("Charlie", -5)
         print("ERROR: negative age should have raised an exception")
     except ValueError as e:
-        print(f"Person('Charlie', -5) correctly raised ValueError: {e}")
+        if verbose:
+            print(f"Person('Charlie', -5) correctly raised ValueError: {e}")
     
     # Test child
     child = mathpy.Person("Emma", 10)
-    print(f"Created child: {child}")
+    if __debug__:
+        if verbose:
+            print(f"Created child: {child}")
     is_adult = child.is_adult()
-    print(f"child.is_adult() = {is_adult}")
-    assert is_adult == False, "Child should not be adult"
+    if __debug__:
+        if verbose:
+            print(f"child.is_adult() = {is_adult}")
+        assert is_adult == False, "Child should not be adult"
+    
+    # Test PersonTable (names and ages stored as two Rust vectors)
+    table = mathpy.PersonTable(["Alice", "Emma", "Old"], [30, 17, 255])
+    table.have_birthday_all()
+    if __debug__:
+        if verbose:
+            print(f"After have_birthday_all(): {table}, ages = {table.ages()}")
+        assert len(table) == 3, "Table should have 3 people"
+        assert list(table.ages()) == [31, 18, 255], "Ages wrong (255 should saturate)"
+        assert table.count_adults() == 3, "All should be adults"
+        assert table.get(1).name == "Emma" and table.get(1).age == 18, "get(1) wrong"
+    
+    try:
+        mathpy.PersonTable(["Alice"], [30, 40])
+        print("ERROR: mismatched PersonTable columns should have raised an exception")
+    except ValueError as e:
+        if verbose:
+            print(f"PersonTable(['Alice'], [30, 40]) correctly raised ValueError: {e}")
     
     print("\n✓ All Person class tests passed!\n")
 
 
+def bench_counter(n=10**6):
+    """Compare n calls to Counter.increment() with one increment_by(n).
+
+    Each method call crosses from Python into Rust, so a loop of n calls
+    pays that cost n times, while increment_by(n) pays it once.
+    """
+    print("=" * 60)
+    print("Benchmark: Counter.increment() vs increment_by()")
+    print("=" * 60)
+    
+    counter = mathpy.Counter()
+    increment = counter.increment  # look the method up once, not n times
+    start = time.perf_counter_ns()
+    for _ in range(n):
+        increment()
+    loop_ns = time.perf_counter_ns() - start
+    assert counter.get_value() == n, "increment() loop miscounted"
+    
+    counter.reset()
+    start = time.perf_counter_ns()
+    counter.increment_by(n)
+    batch_ns = time.perf_counter_ns() - start
+    assert counter.get_value() == n, "increment_by() miscounted"
+    
+    print(f"{n} x increment():     {loop_ns / 1e6:10.2f} ms ({loop_ns / n:.0f} ns per call)")
+    print(f"1 x increment_by({n}): {batch_ns / 1e6:10.4f} ms")
+    print(f"Speedup: {loop_ns / max(batch_ns, 1):.0f}x\n")
+
+
+def bench_pairwise_distance(n=10**6):
+    """Compare pairwise_distance on float64 with pairwise_distance_f32.
+
+    float32 halves the bytes per coordinate, so a SIMD register holds twice
+    as many values and the arrays need half the memory bandwidth.
+    """
+    print("=" * 60)
+    print("Benchmark: pairwise_distance (float64) vs pairwise_distance_f32")
+    print("=" * 60)
+    
+    rng = np.random.default_rng(0)
+    a = rng.uniform(-100.0, 100.0, size=(n, 2))
+    b = rng.uniform(-100.0, 100.0, size=(n, 2))
+    a32 = a.astype(np.float32)
+    b32 = b.astype(np.float32)
+    
+    t64 = best_time_ns(mathpy.pairwise_distance, a, b)
+    t32 = best_time_ns(mathpy.pairwise_distance_f32, a32, b32)
+    error = np.max(np.abs(mathpy.pairwise_distance_f32(a32, b32)
+                          - mathpy.pairwise_distance(a, b)))
+    print(f"float64: {t64 / 1e6:8.3f} ms")
+    print(f"float32: {t32 / 1e6:8.3f} ms (max abs error {error:.1e})")
+    print(f"Speedup: {t64 / max(t32, 1):.2f}x\n")
+
+
+def bench_call_overhead(number=10**6):
+    """Compare the cost of trivial calls into PyO3 and into Cython.
+
+    Both sides do almost no work, so the times are dominated by the cost
+    of the call itself. Calls with arguments are timed through a Python
+    lambda; the "empty lambda" row is the part of those times that is not
+    the extension. Calls without arguments are timed directly.
+    Needs the optional mathpy_cy module (see examples/mathpy_cy.pyx).
+    """
+    print("=" * 60)
+    print("Benchmark: PyO3 vs Cython call overhead")
+    print("=" * 60)
+    
+    if mathpy_cy is None:
+        print("(mathpy_cy not built, skipping; see examples/mathpy_cy.pyx)\n")
+        return
+    
+    # Look every function and method up once, so the timed loop only
+    # makes the call (no LOAD_ATTR/LOAD_GLOBAL per iteration)
+    rust_add, cy_add = mathpy.add, mathpy_cy.add
+    rust_counter, cy_counter = mathpy.Counter(), mathpy_cy.Counter()
+    rust_increment_by, cy_increment_by = rust_counter.increment_by, cy_counter.increment_by
+    cases = [
+        ("empty lambda", lambda: None, lambda: None),
+        ("add(1, 2)", lambda: rust_add(1, 2), lambda: cy_add(1, 2)),
+        ("Counter.increment_by(2)",
+         lambda: rust_increment_by(2), lambda: cy_increment_by(2)),
+        # No arguments, so timeit can call the bound methods directly
+        ("Counter.increment()", rust_counter.increment, cy_counter.increment),
+    ]
+    
+    print(f"{'call':<26} {'PyO3':>10} {'Cython':>10}")
+    for name, rust_call, cy_call in cases:
+        t_rust = timeit(rust_call, number=number) / number * 1e9
+        t_cy = timeit(cy_call, number=number) / number * 1e9
+        print(f"{name:<26} {t_rust:7.1f} ns {t_cy:7.1f} ns")
+    print()
+
+
+def bench_person_table(n=10**6):
+    """Compare have_birthday() on n Person objects with one PersonTable call.
+
+    n Person objects are n separate Python objects, each updated by its own
+    method call. A PersonTable stores the ages as one u8 array in Rust and
+    updates them all in a single call.
+    """
+    print("=" * 60)
+    print("Benchmark: Person.have_birthday() vs PersonTable.have_birthday_all()")
+    print("=" * 60)
+    
+    names = [f"person{i}" for i in range(n)]
+    ages = [i % 100 for i in range(n)]
+    
+    start = time.perf_counter_ns()
+    people = [mathpy.Person(name, age) for name, age in zip(names, ages)]
+    create_objects_ns = time.perf_counter_ns() - start
+    
+    have_birthday = mathpy.Person.have_birthday  # look the method up once
+    start = time.perf_counter_ns()
+    for person in people:
+        have_birthday(person)
+    objects_ns = time.perf_counter_ns() - start
+    
+    start = time.perf_counter_ns()
+    table = mathpy.PersonTable(names, ages)
+    create_table_ns = time.perf_counter_ns() - start
+    
+    start = time.perf_counter_ns()
+    table.have_birthday_all()
+    table_ns = time.perf_counter_ns() - start
+    
+    assert people[-1].age == table.get(n - 1).age, "Ages disagree"
+    rows = [
+        (f"Create {n} Person objects:", create_objects_ns),
+        (f"Create PersonTable({n}):", create_table_ns),
+        (f"{n} x have_birthday():", objects_ns),
+        ("1 x have_birthday_all():", table_ns),
+    ]
+    for label, elapsed in rows:
+        print(f"{label:<32} {elapsed / 1e6:10.3f} ms")
+    print(f"Speedup: {objects_ns / max(table_ns, 1):.0f}x\n")
+
+
+def best_time_ns(func, *args, repeat=5):
+    """Return the fastest of `repeat` runs of func(*args), in nanoseconds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        func(*args)
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench_sum(sizes=(10, 10**7)):
+    """Compare mathpy.sum_list with numpy.sum and a Numba loop.
+
+    Shows which tool fits which workload: for tiny arrays the fixed cost of
+    each call dominates, for large arrays the speed of the inner loop does.
+    Numba is optional and skipped if it is not installed.
+    """
+    print("=" * 60)
+    print("Benchmark: mathpy.sum_list vs numpy.sum vs Numba")
+    print("=" * 60)
+    
+    candidates = [("mathpy.sum_list", mathpy.sum_list), ("numpy.sum", np.sum)]
+    if njit is not None:
+        @njit
+        def numba_sum(a):
+            s = 0
+            for x in a:
+                s += x
+            return s
+        
+        numba_sum(np.arange(1, dtype=np.int64))  # compile before timing
+        candidates.append(("numba njit loop", numba_sum))
+    else:
+        print("(numba not installed, skipping the Numba loop)")
+    
+    for n in sizes:
+        a = np.arange(n, dtype=np.int64)
+        expected = n * (n - 1) // 2
+        print(f"N = {n}:")
+        for name, func in candidates:
+            assert func(a) == expected, f"{name} returned the wrong sum"
+            elapsed = best_time_ns(func, a)
+            print(f"  {name:<16} {elapsed / 1e3:12.1f} us")
+    print()
+
+
+def bench_gil_release(threads=8):
+    """Compare running word_frequency_bytes and pairwise_distance one call at
+    a time with running the same calls from several Python threads.
+
+    Both functions release the GIL while they compute on inputs this large,
+    so the threaded run is only faster if the calls really execute at the
+    same time.
+    """
+    print("=" * 60)
+    print(f"Benchmark: {threads} calls in a row vs on {threads} threads")
+    print("=" * 60)
+    
+    rng = np.random.default_rng(0)
+    corpora = [" ".join([f"corpus{i} shared words"] * 100_000).encode()
+               for i in range(threads)]
+    # The calls only need to be distinct, not their inputs: share one pair
+    a = rng.uniform(-100.0, 100.0, size=(10**6, 2))
+    b = rng.uniform(-100.0, 100.0, size=(10**6, 2))
+    word_frequency_bytes = mathpy.word_frequency_bytes
+    pairwise_distance = mathpy.pairwise_distance
+    
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        rows = [
+            ("word_frequency_bytes",
+             lambda: [word_frequency_bytes(c) for c in corpora],
+             lambda: list(pool.map(word_frequency_bytes, corpora))),
+            ("pairwise_distance",
+             lambda: [pairwise_distance(a, b) for _ in range(threads)],
+             lambda: list(pool.map(pairwise_distance, [a] * threads, [b] * threads))),
+        ]
+        for label, in_a_row, on_threads in rows:
+            t_row = best_time_ns(in_a_row)
+            t_threads = best_time_ns(on_threads)
+            print(f"{label:<22} in a row: {t_row / 1e6:8.2f} ms, "
+                  f"on threads: {t_threads / 1e6:8.2f} ms "
+                  f"({t_row / max(t_threads, 1):.1f}x)")
+    print()
+
+
 def main():
-    """Run all tests."""
+    """Run all tests, and the benchmarks if --bench is given.
+
+    The tests only print their intermediate results with -v/--verbose, so
+    that timing runs are not dominated by string formatting.
+    """
     print("\n" + "=" * 60)
     print("  Python Extension Module Test Suite")
     print("  Powered by PyO3 and Rust")
     print("=" * 60 + "\n")
     
+    if mathpy is None:
+        print(f"ERROR: Failed to import mathpy module: {mathpy_import_error}")
+        print("\nPlease build the module first (release builds are much faster")
+        print("than the default debug build, so use them for timing):")
+        print("  maturin develop --release")
+        print("\nOr build and install a release wheel:")
+        print("  maturin build --release && pip install target/wheels/*.whl")
+        return 1
+    
+    args = sys.argv[1:]
+    verbose = "-v" in args or "--verbose" in args
+    if not __debug__:
+        print("Running under python -O: checks are stripped, only the calls into Rust run.\n")
+    
     try:
-        test_basic_functions()
-        test_string_functions()
-        test_counter_class()
-        test_point_class()
-        test_calculator_class()
-        test_person_class()
+        test_basic_functions(verbose)
+        test_string_functions(verbose)
+        test_counter_class(verbose)
+        test_point_class(verbose)
+        test_calculator_class(verbose)
+        test_person_class(verbose)
         
         print("=" * 60)
         print("  ✓ ALL TESTS PASSED!")
-        print("=" * 60)
+        print("=" * 60 + "\n")
+        
+        if "--bench" in args:
+            bench_counter()
+            bench_call_overhead()
+            bench_sum()
+            bench_pairwise_distance()
+            bench_person_table()
+            bench_gil_release()
         
-    except ImportError as e:
-        print(f"ERROR: Failed to import mathpy module: {e}")
-        print("\nPlease build the module first:")
-        print("  maturin develop")
-        print("\nOr install it:")
-        print("  pip install .")
-        return 1
     except AssertionError as e:
         print(f"\n✗ Test failed: {e}")
         return 1
     except Exception as e:
-        print(f"\n✗ Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"\n✗ Unexpected error: {e!r}")
+        if os.environ.get("MATHPY_VERBOSE_TB"):
+            import traceback
+            traceback.print_exc()
+        else:
+            print("Set MATHPY_VERBOSE_TB=1 for the full traceback.")
         return 1
     
     return 0
 
 
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
@@ -0,0 +1,131 @@
+"""
+Benchmarks for the mathpy Python extension module.
+
+Uses pytest-benchmark, which warms up each function and calibrates how many
+calls to time per round, so even calls that take tens of nanoseconds get
+stable numbers (reported as min/median/IQR per test).
+
+Run with:
+    pip install pytest pytest-benchmark
+    pytest examples/test_benchmarks.py
+"""
+
+from array import array
+
+import numpy as np
+import pytest
+
+mathpy = pytest.importorskip("mathpy")
+
+SIZES = [1, 10, 1000, 10**6]
+
+
+# ============================================================================
+# Scalar functions (one call into Rust per operation)
+# ============================================================================
+
+@pytest.mark.benchmark(group="scalar")
+def test_add(benchmark):
+    assert benchmark(mathpy.add, 5, 3) == 8
+
+
+@pytest.mark.benchmark(group="scalar")
+def test_multiply(benchmark):
+    assert benchmark(mathpy.multiply, 6, 7) == 42
+
+
+@pytest.mark.benchmark(group="scalar")
+def test_devide(benchmark):
+    assert benchmark(mathpy.devide, 10.0, 2.0) == 5.0
+
+
+@pytest.mark.benchmark(group="scalar")
+def test_counter_increment(benchmark):
+    counter = mathpy.Counter()
+    benchmark(counter.increment)
+    assert counter.get_value() > 0
+
+
+# ============================================================================
+# Batch functions (one call into Rust per array)
+# ============================================================================
+
+@pytest.mark.benchmark(group="add_many")
+@pytest.mark.parametrize("n", SIZES)
+def test_add_many(benchmark, n):
+    a = np.arange(n, dtype=np.int64)
+    b = a[::-1].copy()
+    result = benchmark(mathpy.add_many, a, b)
+    assert np.array_equal(result, a + b)
+
+
+@pytest.mark.benchmark(group="multiply_many")
+@pytest.mark.parametrize("n", SIZES)
+def test_multiply_many(benchmark, n):
+    a = np.arange(n, dtype=np.int64)
+    b = a[::-1].copy()
+    result = benchmark(mathpy.multiply_many, a, b)
+    assert np.array_equal(result, a * b)
+
+
+@pytest.mark.benchmark(group="devide_many")
+@pytest.mark.parametrize("n", SIZES)
+def test_devide_many(benchmark, n):
+    a = np.arange(n, dtype=np.float64)
+    b = np.arange(1, n + 1, dtype=np.float64)
+    result = benchmark(mathpy.devide_many, a, b)
+    assert np.array_equal(result, a / b)
+
+
+@pytest.mark.benchmark(group="sum_list")
+@pytest.mark.parametrize("n", SIZES)
+def test_sum_list(benchmark, n):
+    a = np.arange(n, dtype=np.int64)
+    assert benchmark(mathpy.sum_list, a) == n * (n - 1) // 2
+
+
+@pytest.mark.benchmark(group="sum_list_inputs")
+@pytest.mark.parametrize("kind", ["numpy", "array", "list"])
+def test_sum_list_inputs(benchmark, kind):
+    n = 10**6
+    numbers = {
+        "numpy": lambda: np.arange(n, dtype=np.int64),
+        "array": lambda: array("q", range(n)),
+        "list": lambda: list(range(n)),
+    }[kind]()
+    assert benchmark(mathpy.sum_list, numbers) == n * (n - 1) // 2
+
+
+@pytest.mark.benchmark(group="max_list")
+@pytest.mark.parametrize("n", SIZES)
+def test_max_list(benchmark, n):
+    a = np.arange(n, dtype=np.int64)
+    assert benchmark(mathpy.max_list, a) == n - 1
+
+
+@pytest.mark.benchmark(group="pairwise_distance")
+@pytest.mark.parametrize("n", SIZES)
+def test_pairwise_distance(benchmark, n):
+    rng = np.random.default_rng(0)
+    a = rng.uniform(-100.0, 100.0, size=(n, 2))
+    b = rng.uniform(-100.0, 100.0, size=(n, 2))
+    result = benchmark(mathpy.pairwise_distance, a, b)
+    assert np.allclose(result, np.hypot(*(a - b).T))
+
+
+@pytest.mark.benchmark(group="pairwise_distance_f32")
+@pytest.mark.parametrize("n", SIZES)
+def test_pairwise_distance_f32(benchmark, n):
+    rng = np.random.default_rng(0)
+    a = rng.uniform(-100.0, 100.0, size=(n, 2)).astype(np.float32)
+    b = rng.uniform(-100.0, 100.0, size=(n, 2)).astype(np.float32)
+    result = benchmark(mathpy.pairwise_distance_f32, a, b)
+    assert np.allclose(result, np.hypot(*(a - b).T), rtol=1e-4)
+
+
+@pytest.mark.benchmark(group="word_frequency_bytes")
+@pytest.mark.parametrize("n", SIZES)
+def test_word_frequency_bytes(benchmark, n):
+    corpus = " ".join(["the quick brown fox"] * n).encode()
+    result = benchmark(mathpy.word_frequency_bytes, corpus)
+    assert result[b"the"] == n